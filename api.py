@@ -1,7 +1,9 @@
 from flask import Flask, request, jsonify
+import hashlib
+import json
 import os
-from orchestrator import SkillOrchestrator
-from nostr_client import NostrClient
+import time
+from functools import lru_cache
 import logging
 
 app = Flask(__name__)
@@ -10,10 +12,39 @@ app = Flask(__name__)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Constant health payload and its ETag, computed once at import
+HEALTH_PAYLOAD = {"status": "healthy", "service": "clawstr-orchestrator"}
+HEALTH_ETAG = hashlib.md5(json.dumps(HEALTH_PAYLOAD, sort_keys=True).encode()).hexdigest()
+
+
+# Heavy modules (nostr stack, orchestrator) are imported lazily so
+# serverless cold starts of /health don't pay for them
+@lru_cache(maxsize=1)
+def _orchestrator_cls():
+    from orchestrator import SkillOrchestrator
+    return SkillOrchestrator
+
+
+@lru_cache(maxsize=1)
+def _nostr_client_cls():
+    from nostr_client import NostrClient
+    return NostrClient
+
+
+def _etag_response(payload, etag):
+    """Return the payload with ETag headers, or a bodyless 304 on match."""
+    if etag in request.if_none_match:
+        return '', 304
+    resp = jsonify(payload)
+    resp.set_etag(etag)
+    resp.headers['Cache-Control'] = 'public, max-age=60'
+    return resp
+
+
 @app.route('/health')
 def health_check():
     """Health check endpoint for Vercel."""
-    return jsonify({"status": "healthy", "service": "clawstr-orchestrator"})
+    return _etag_response(HEALTH_PAYLOAD, HEALTH_ETAG)
 
 @app.route('/orchestrate', methods=['POST'])
 def trigger_orchestration():
@@ -23,7 +54,7 @@ def trigger_orchestration():
         repo_path = os.getcwd()
 
         # Initialize orchestrator
-        orchestrator = SkillOrchestrator(repo_path)
+        orchestrator = _orchestrator_cls()(repo_path)
 
         # Run discovery phase only (no git operations on Vercel)
         skills = orchestrator.discover_skills()
@@ -39,13 +70,20 @@ def trigger_orchestration():
         logger.error(f"Orchestration failed: {e}")
         return jsonify({"status": "error", "message": str(e)}), 500
 
+@lru_cache(maxsize=2)
+def _cached_metadata(time_bucket: int):
+    """Build agent metadata, memoized per 60s bucket."""
+    client = _nostr_client_cls()()
+    return client.get_metadata()
+
+
 @app.route('/metadata')
 def get_metadata():
     """Get agent metadata for Nostr broadcasting."""
     try:
-        client = NostrClient()
-        metadata = client.get_metadata()
-        return jsonify(metadata)
+        metadata = _cached_metadata(int(time.time() // 60))
+        etag = hashlib.md5(json.dumps(metadata, sort_keys=True).encode()).hexdigest()
+        return _etag_response(metadata, etag)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
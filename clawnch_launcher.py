@@ -5,7 +5,6 @@ Handles posting Kind 1 events to launch tokens on Clawnch.
 Ensures token launch logic only triggers once upon initial setup.
 """
 
-import os
 import json
 import time
 import logging
@@ -15,13 +14,10 @@ from datetime import datetime
 
 from nostr.key import PrivateKey
 from nostr.event import Event, EventKind
-from nostr.relay_manager import RelayManager
 from nostr.message_type import ClientMessageType
 
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from nostr_pool import get_relay
+from settings import settings
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -36,22 +32,31 @@ class ClawnchLauncher:
     the token on the Base network automatically.
     """
 
+    # Launch state shared across instances: the flag file is stat'd once
+    # per process, not on every launcher construction
+    _launched_cache: Optional[bool] = None
+
     def __init__(self):
         """Initialize Clawnch launcher with configuration."""
-        self.nsec = os.getenv('NOSTR_NSEC')
-        self.relay_url = os.getenv('NOSTR_RELAY', 'wss://lightningrelay.com')
-        self.token_ticker = os.getenv('TOKEN_TICKER', 'SKILL')
-        self.agent_name = os.getenv('AGENT_NAME', 'MasterOrchestrator')
+        config = settings()
+        self.nsec = config.nsec
+        self.relay_url = config.relay_url
+        self.token_ticker = config.token_ticker
+        self.agent_name = config.agent_name
 
         if not self.nsec:
             raise ValueError("NOSTR_NSEC environment variable is required")
 
         self.private_key = PrivateKey.from_nsec(self.nsec)
         self.public_key = self.private_key.public_key
+        self._pub_hex = self.public_key.hex()
+        self._priv_hex = self.private_key.hex()
 
         # Track if token has been launched
         self.launch_file = Path('.clawnch_launched')
-        self._launched = self.launch_file.exists()
+        if ClawnchLauncher._launched_cache is None:
+            ClawnchLauncher._launched_cache = self.launch_file.exists()
+        self._launched = ClawnchLauncher._launched_cache
 
     def is_launched(self) -> bool:
         """Check if token has already been launched."""
@@ -73,35 +78,27 @@ class ClawnchLauncher:
 
             # Create Kind 1 event
             event = Event(
-                public_key=self.public_key.hex(),
+                public_key=self._pub_hex,
                 content=message,
                 kind=EventKind.TEXT_NOTE,
                 created_at=int(time.time())
             )
 
             # Sign the event
-            event.sign(self.private_key.hex())
-
-            # Connect to relay and publish
-            relay_manager = RelayManager()
-            relay_manager.add_relay(self.relay_url)
-            relay_manager.open_connections()
-
-            # Wait for connections
-            time.sleep(2)
-
-            # Publish the event
-            relay_manager.publish_event(event)
-
-            # Wait for publication
-            time.sleep(2)
+            event.sign(self._priv_hex)
 
-            # Close connections
-            relay_manager.close_connections()
+            # Publish via the shared persistent relay pool
+            pool = get_relay(self.relay_url)
+            try:
+                relay_manager = pool.acquire()
+                relay_manager.publish_event(event)
+            finally:
+                pool.release()
 
-            # Mark as launched
+            # Mark as launched (instance and process-wide)
             self.launch_file.touch()
             self._launched = True
+            ClawnchLauncher._launched_cache = True
 
             logger.info(f"Token ${self.token_ticker} launched successfully on Clawnch")
             return True
@@ -115,4 +112,5 @@ class ClawnchLauncher:
         if self.launch_file.exists():
             self.launch_file.unlink()
             self._launched = False
+            ClawnchLauncher._launched_cache = False
             logger.info("Launch status reset")
\ No newline at end of file
@@ -8,8 +8,10 @@ Provides HTTP health check endpoint for Railway deployment monitoring.
 import os
 import sys
 import json
+import time
+import hashlib
 import logging
-from flask import Flask, jsonify
+from flask import Flask, jsonify, request
 from pathlib import Path
 
 # Add current directory to path for imports
@@ -21,38 +23,64 @@ app = Flask(__name__)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Required environment variables, checked once at import so per-request
+# health probes don't re-scan the environment
+REQUIRED_ENV = ['NOSTR_NSEC', 'AGENT_NAME']
+MISSING_ENV = [env for env in REQUIRED_ENV if not os.getenv(env)]
+
+# Cached filesystem state for /health, refreshed at most every 30s so
+# frequent Railway probes don't re-stat and re-glob on every hit
+REPO_STATE_TTL = 30
+_repo_state_cache = None
+_repo_state_expiry = 0.0
+
+
+def _repo_state():
+    """
+    Get (is_git_repo, skills_dir_exists, skill_count), cached for REPO_STATE_TTL.
+
+    Returns:
+        Tuple of repository state used by the health check.
+    """
+    global _repo_state_cache, _repo_state_expiry
+
+    now = time.monotonic()
+    if _repo_state_cache is None or now >= _repo_state_expiry:
+        is_git_repo = Path('.git').exists()
+        skills_exists = Path('skills').exists()
+        skill_count = len(list(Path('skills').glob('*.md'))) if skills_exists else 0
+        _repo_state_cache = (is_git_repo, skills_exists, skill_count)
+        _repo_state_expiry = now + REPO_STATE_TTL
+
+    return _repo_state_cache
+
 @app.route('/health')
 def health_check():
     """Railway health check endpoint."""
     try:
+        is_git_repo, skills_exists, skill_count = _repo_state()
+
         # Check if we're in a git repository
-        if not Path('.git').exists():
+        if not is_git_repo:
             return jsonify({
                 "status": "unhealthy",
                 "error": "Not a git repository"
             }), 500
 
         # Check if required environment variables are set
-        required_env = ['NOSTR_NSEC', 'AGENT_NAME']
-        missing_env = [env for env in required_env if not os.getenv(env)]
-
-        if missing_env:
+        if MISSING_ENV:
             return jsonify({
                 "status": "unhealthy",
-                "error": f"Missing environment variables: {missing_env}"
+                "error": f"Missing environment variables: {MISSING_ENV}"
             }), 500
 
         # Check if skills directory exists
-        if not Path('skills').exists():
+        if not skills_exists:
             return jsonify({
                 "status": "warning",
                 "message": "Skills directory not found"
             }), 200
 
-        # Count skills
-        skill_files = list(Path('skills').glob('*.md'))
-        skill_count = len(skill_files)
-
         return jsonify({
             "status": "healthy",
             "skills_count": skill_count,
@@ -67,15 +95,37 @@ def health_check():
             "error": str(e)
         }), 500
 
+# Constant root payload and its ETag, computed once at import
+ROOT_PAYLOAD = {
+    "service": "Clawstr Skill Orchestrator",
+    "version": "1.0.0",
+    "status": "running"
+}
+ROOT_ETAG = hashlib.md5(json.dumps(ROOT_PAYLOAD, sort_keys=True).encode()).hexdigest()
+
+
 @app.route('/')
 def root():
     """Root endpoint with basic info."""
-    return jsonify({
-        "service": "Clawstr Skill Orchestrator",
-        "version": "1.0.0",
-        "status": "running"
-    })
+    if ROOT_ETAG in request.if_none_match:
+        return '', 304
+    resp = jsonify(ROOT_PAYLOAD)
+    resp.set_etag(ROOT_ETAG)
+    resp.headers['Cache-Control'] = 'public, max-age=60'
+    return resp
 
 if __name__ == '__main__':
     port = int(os.getenv('PORT', 8000))
-    app.run(host='0.0.0.0', port=port)
\ No newline at end of file
+    try:
+        from waitress import serve
+        serve(
+            app,
+            host='0.0.0.0',
+            port=port,
+            threads=8,
+            connection_limit=512,
+            channel_timeout=30
+        )
+    except ImportError:
+        logger.warning("waitress not installed, falling back to Flask dev server")
+        app.run(host='0.0.0.0', port=port)
\ No newline at end of file
@@ -8,12 +8,25 @@ Can be deployed as a GitHub Action or standalone service.
 
 import os
 import sys
+import json
 import time
+import atexit
+import signal
+import hashlib
 import logging
 import argparse
+import threading
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from orchestrator import SkillOrchestrator, SkillOrchestratorConfig
 from nostr_client import NostrClient
@@ -31,6 +44,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Frontmatter is typically < 2 KB; read one chunk first and only pull
+# the rest of the file when actually needed
+_FRONTMATTER_CHUNK = 8192
+
 
 class HeartbeatOrchestrator:
     """Manages scheduled execution of the skill orchestrator."""
@@ -55,8 +72,21 @@ class HeartbeatOrchestrator:
         self.interval = timedelta(hours=interval_hours)
         self.auto_commit = auto_commit
         self.auto_push = auto_push
-        self.last_run = None
-        
+        self.last_run = None  # wall clock, for log display only
+        self._interval_s = interval_hours * 3600
+        self._last_mono: Optional[float] = None  # scheduling uses the monotonic clock
+        self._stop = threading.Event()
+
+        # One long-lived Nostr client; the pooled relay connection and
+        # parsed private key persist for the life of the process
+        self.nostr = None
+        try:
+            self.nostr = NostrClient()
+            self.nostr.connect()
+            atexit.register(self.nostr.disconnect)
+        except Exception as e:
+            logger.error(f"Nostr client unavailable: {e}")
+
         # Perform initial setup
         self._initial_setup()
         
@@ -73,34 +103,39 @@ class HeartbeatOrchestrator:
             Dictionary with skill data for Nostr, or None if parsing failed.
         """
         try:
-            import yaml
-            from pathlib import Path
-            
-            content = skill_path.read_text(encoding='utf-8')
-            
-            # Extract YAML frontmatter
-            if content.startswith('---'):
-                end_pos = content.find('---', 3)
-                if end_pos != -1:
-                    frontmatter = content[3:end_pos].strip()
-                    metadata = yaml.safe_load(frontmatter)
-                    
-                    # Extract body content
-                    body = content[end_pos + 3:].strip()
-                    
-                    return {
-                        'title': metadata.get('title', skill_path.stem),
-                        'description': metadata.get('description', ''),
-                        'version': metadata.get('version', '1.0.0'),
-                        'instructions': body,
-                        'tool_calls': metadata.get('tool_calls', []),
-                        'identifier': metadata.get('identifier', f"skill-{skill_path.stem}"),
-                        'category': metadata.get('category', 'general')
-                    }
-            
-            logger.warning(f"No valid frontmatter found in {skill_path}")
-            return None
-            
+            with open(skill_path, 'rb') as f:
+                head = f.read(_FRONTMATTER_CHUNK)
+
+                if not head.startswith(b'---\n'):
+                    logger.warning(f"No valid frontmatter found in {skill_path}")
+                    return None
+
+                end = head.find(b'\n---', 4)
+                if end == -1:
+                    # Frontmatter spills past the first chunk; read the rest
+                    head += f.read()
+                    end = head.find(b'\n---', 4)
+                    if end == -1:
+                        logger.warning(f"No valid frontmatter found in {skill_path}")
+                        return None
+
+                metadata = yaml.load(head[4:end], Loader=_YamlLoader)
+                rest = f.read()
+                body_bytes = head[end + 4:] + rest
+
+            body = body_bytes.decode('utf-8').strip()
+
+            return {
+                'title': metadata.get('title', skill_path.stem),
+                'description': metadata.get('description', ''),
+                'version': metadata.get('version', '1.0.0'),
+                'instructions': body,
+                'tool_calls': metadata.get('tool_calls', []),
+                'identifier': metadata.get('identifier', f"skill-{skill_path.stem}"),
+                'category': metadata.get('category', 'general'),
+                'hash': hashlib.blake2b(head + rest, digest_size=16).hexdigest()
+            }
+
         except Exception as e:
             logger.error(f"Failed to parse skill file {skill_path}: {e}")
             return None
@@ -109,18 +144,17 @@ class HeartbeatOrchestrator:
         """Perform initial setup: broadcast metadata and launch token if needed."""
         try:
             # Broadcast agent metadata
-            with NostrClient() as nostr_client:
-                nostr_client.broadcast_metadata()
+            if self.nostr:
+                self.nostr.broadcast_metadata()
                 logger.info("Broadcasted agent metadata to Nostr")
-            
+
             # Launch token if not already done
-            with ClawnchLauncher() as launcher:
-                event_id = launcher.launch_token()
-                if event_id:
-                    logger.info(f"Launched token on Clawnch: {event_id}")
-                else:
-                    logger.info("Token already launched")
-                    
+            launcher = ClawnchLauncher()
+            if launcher.launch_token():
+                logger.info("Launched token on Clawnch")
+            else:
+                logger.info("Token already launched")
+
         except Exception as e:
             logger.error(f"Initial setup failed: {e}")
     
@@ -131,10 +165,10 @@ class HeartbeatOrchestrator:
         Returns:
             True if interval has elapsed since last run.
         """
-        if self.last_run is None:
+        if self._last_mono is None:
             return True
-        
-        return datetime.now() - self.last_run >= self.interval
+
+        return time.monotonic() - self._last_mono >= self._interval_s
     
     def run_orchestration(self) -> bool:
         """
@@ -163,23 +197,50 @@ class HeartbeatOrchestrator:
                 if result.get("skills_published", 0) > 0:
                     logger.info("Skills were updated. Broadcasting to Nostr...")
                     try:
-                        with NostrClient() as nostr_client:
-                            # Publish each consolidated skill
-                            for skill_file in result.get("published_files", []):
-                                skill_path = Path(skill_file)
-                                if skill_path.exists():
-                                    # Parse the skill file to get metadata
-                                    skill_data = self._parse_skill_for_nostr(skill_path)
-                                    if skill_data:
-                                        # Determine category (could be enhanced with better logic)
-                                        category = skill_data.get('category', 'general')
-                                        nostr_client.publish_skill(skill_data, category)
-                                        logger.info(f"Published skill to Nostr: {skill_data.get('title')}")
+                        # Parse skill files in parallel (I/O-bound reads),
+                        # then publish the whole batch in one relay write
+                        skill_paths = [
+                            Path(f) for f in result.get("published_files", [])
+                            if Path(f).exists()
+                        ]
+                        with ThreadPoolExecutor(max_workers=8) as executor:
+                            parsed = list(executor.map(self._parse_skill_for_nostr, skill_paths))
+
+                        # Skip skills whose content hash matches what was
+                        # already sent to Nostr
+                        cache_path = Path(self.repo_path) / '.nostr_publish_cache.json'
+                        try:
+                            publish_cache = json.loads(cache_path.read_text() or '{}')
+                        except (OSError, ValueError):
+                            publish_cache = {}
+
+                        to_publish = [
+                            (skill_data, skill_data.get('category', 'general'))
+                            for skill_data in parsed
+                            if skill_data
+                            and publish_cache.get(skill_data['identifier']) != skill_data['hash']
+                        ]
+
+                        if to_publish and self.nostr:
+                            self.nostr.publish_skills_batch(to_publish)
+                            logger.info(f"Published {len(to_publish)} skills to Nostr")
+
+                            # Persist the updated hashes atomically
+                            for skill_data, _ in to_publish:
+                                publish_cache[skill_data['identifier']] = skill_data['hash']
+                            tmp_path = cache_path.with_suffix('.json.tmp')
+                            tmp_path.write_text(json.dumps(publish_cache))
+                            os.replace(tmp_path, cache_path)
+                        elif to_publish:
+                            logger.warning("Nostr client unavailable, skipping publish")
+                        else:
+                            logger.info("All skills unchanged since last publish")
                     except Exception as e:
                         logger.error(f"Failed to publish to Nostr: {e}")
                 
                 logger.info(f"Orchestration successful: {result}")
                 self.last_run = datetime.now()
+                self._last_mono = time.monotonic()
                 return True
             else:
                 logger.warning(f"Orchestration result: {result}")
@@ -202,19 +263,29 @@ class HeartbeatOrchestrator:
             if run_once:
                 self.run_orchestration()
             else:
-                while True:
+                while not self._stop.is_set():
                     if self.should_run():
                         self.run_orchestration()
+
+                    # Sleep exactly until the next scheduled run; the stop
+                    # event wakes us immediately on shutdown
+                    if self._last_mono is not None:
+                        remaining = self._interval_s - (time.monotonic() - self._last_mono)
+                        delay = max(1.0, remaining)
+                        logger.info(f"Next run in {timedelta(seconds=int(delay))}. Sleeping...")
                     else:
-                        wait_time = (self.last_run + self.interval) - datetime.now()
-                        logger.info(f"Next run in {wait_time}. Sleeping...")
-                        time.sleep(60)  # Check every minute
-        
+                        delay = 60.0
+                    self._stop.wait(timeout=delay)
+
         except KeyboardInterrupt:
             logger.info("Heartbeat interrupted by user")
         except Exception as e:
             logger.error(f"Fatal error in heartbeat loop: {e}", exc_info=True)
 
+    def stop(self) -> None:
+        """Signal the heartbeat loop to exit at the next wakeup."""
+        self._stop.set()
+
 
 def main():
     """Main entry point for the heartbeat script."""
@@ -296,7 +367,10 @@ def main():
         auto_commit=not args.no_commit,
         auto_push=args.auto_push
     )
-    
+
+    # Allow clean, immediate shutdown on SIGTERM (Railway/Docker stop)
+    signal.signal(signal.SIGTERM, lambda signum, frame: heartbeat.stop())
+
     heartbeat.run_loop(run_once=args.run_once)
 
 
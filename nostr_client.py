@@ -9,27 +9,84 @@ import os
 import json
 import time
 import logging
-from typing import Dict, Any, Optional
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 
 from nostr.key import PrivateKey
 from nostr.event import Event, EventKind
-from nostr.relay_manager import RelayManager
 from nostr.message_type import ClientMessageType
 from nostr.filter import Filter, Filters
 from nostr.subscription import Subscription
 
-from dotenv import load_dotenv
+from nostr_pool import get_relay
+from settings import settings
 from utils.git_manager import GitManager
 
-# Load environment variables
-load_dotenv()
+try:
+    import orjson
+
+    def _json_dumps(obj, sort_keys: bool = False) -> str:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(obj, option=option).decode()
+except ImportError:
+    def _json_dumps(obj, sort_keys: bool = False) -> str:
+        return json.dumps(obj, sort_keys=sort_keys)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Batches at least this large fan signing out across worker processes;
+# smaller ones sign inline to avoid IPC overhead
+_SIGN_POOL_MIN_BATCH = 8
+
+# Markdown layout for published skill events, built once at import
+_SKILL_TEMPLATE = """# {title}
+
+{description}
+
+## Version
+{version}
+
+## Instructions
+{instructions}
+
+## Tool Calls
+{tool_calls_json}
+
+---
+Published by {agent_name} - Autonomous Skill Orchestrator
+"""
+
+_sign_pool = None
+_sign_pool_lock = threading.Lock()
+
+
+def _get_sign_pool() -> ProcessPoolExecutor:
+    """Lazily create the shared signing process pool (fork cost paid once)."""
+    global _sign_pool
+    if _sign_pool is None:
+        with _sign_pool_lock:
+            if _sign_pool is None:
+                _sign_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _sign_pool
+
+
+def _sign_event_worker(args):
+    """
+    Sign one event in a worker process.
+
+    Top-level function so it is picklable; takes (event_params, privkey_hex)
+    and returns (event_id, event_json_object).
+    """
+    event_params, privkey_hex = args
+    event = Event(**event_params)
+    event.sign(privkey_hex)
+    return event.id, event.to_json_object()
+
 
 class NostrClient:
     """
@@ -43,21 +100,25 @@ class NostrClient:
 
     def __init__(self, repo_path: Optional[str] = None):
         """Initialize Nostr client with private key and relay."""
-        self.nsec = os.getenv('NOSTR_NSEC')
-        self.relay_url = os.getenv('NOSTR_RELAY', 'wss://lightningrelay.com')
-        self.agent_name = os.getenv('AGENT_NAME', 'MasterOrchestrator')
+        config = settings()
+        self.nsec = config.nsec
+        self.relay_url = config.relay_url
+        self.agent_name = config.agent_name
         self.repo_path = repo_path or os.getcwd()
 
         if not self.nsec:
             raise ValueError("NOSTR_NSEC environment variable is required")
 
-        # Initialize private key
+        # Initialize private key; hex encodings are cached since every
+        # event build/sign needs them
         self.private_key = PrivateKey.from_nsec(self.nsec)
         self.public_key = self.private_key.public_key
+        self._pub_hex = self.public_key.hex()
+        self._priv_hex = self.private_key.hex()
 
-        # Initialize relay manager
-        self.relay_manager = RelayManager()
-        self.relay_manager.add_relay(self.relay_url)
+        # Shared persistent relay connection pool
+        self.pool = get_relay(self.relay_url)
+        self.relay_manager = self.pool.relay_manager
 
         # Initialize Git manager for autodetecting GitHub repo
         try:
@@ -66,18 +127,20 @@ class NostrClient:
             logger.warning("Not a git repository, GitHub autodetection disabled")
             self.git_manager = None
 
+        # Cache of the last signed metadata event: (created_monotonic, event)
+        self._meta_event_cache: Optional[Tuple[float, Event]] = None
+
         logger.info(f"Initialized Nostr client for {self.agent_name}")
 
     def connect(self):
-        """Connect to the Nostr relay."""
-        self.relay_manager.open_connections()
-        time.sleep(2)  # Allow connection to establish
+        """Connect to the Nostr relay (reuses the pooled websocket)."""
+        self.relay_manager = self.pool.acquire()
         logger.info(f"Connected to relay: {self.relay_url}")
 
     def disconnect(self):
-        """Disconnect from the relay."""
-        self.relay_manager.close_connections()
-        logger.info("Disconnected from relay")
+        """Release the pooled relay connection (stays open for reuse)."""
+        self.pool.release()
+        logger.info("Released relay connection")
 
     def get_metadata(self) -> Dict[str, str]:
         """
@@ -110,49 +173,52 @@ class NostrClient:
         Broadcast Kind 0 (Metadata) event for agent profile.
 
         Sets the agent's name, bio, and GitHub repo link.
-        """
-        metadata = self.get_metadata()
-
-        event = Event(
-            public_key=self.public_key.hex(),
-            content=json.dumps(metadata),
-            kind=EventKind.SET_METADATA,
-            created_at=int(time.time())
-        )
-
-        event.sign(self.private_key.hex())
 
-        message = json.dumps([ClientMessageType.EVENT, event.to_json_object()])
+        The signed event is cached for 60s: metadata is constant per
+        process, so repeat broadcasts skip the JSON build and signature.
+        """
+        now = time.monotonic()
+        if self._meta_event_cache and now - self._meta_event_cache[0] < 60:
+            event = self._meta_event_cache[1]
+        else:
+            metadata = self.get_metadata()
+
+            event = Event(
+                public_key=self._pub_hex,
+                content=_json_dumps(metadata, sort_keys=True),
+                kind=EventKind.SET_METADATA,
+                created_at=int(time.time())
+            )
+
+            event.sign(self._priv_hex)
+            self._meta_event_cache = (now, event)
+
+        message = _json_dumps([ClientMessageType.EVENT, event.to_json_object()])
         self.relay_manager.publish_message(message)
 
         logger.info(f"Broadcasted metadata event: {event.id}")
         return event.id
 
-    def publish_skill(self, skill_data: Dict[str, Any], category: str):
+    def _build_skill_event(self, skill_data: Dict[str, Any], category: str) -> Event:
         """
-        Broadcast Kind 30023 (Long-form Content) event for skill updates.
+        Build an unsigned Kind 30023 (Long-form Content) event for a skill.
 
         Args:
             skill_data: Dictionary containing skill information
             category: Skill category for tagging
-        """
-        # Create content with skill details
-        content = f"""# {skill_data.get('title', 'Skill Update')}
 
-{skill_data.get('description', '')}
-
-## Version
-{skill_data.get('version', '1.0.0')}
-
-## Instructions
-{skill_data.get('instructions', '')}
-
-## Tool Calls
-{json.dumps(skill_data.get('tool_calls', []), indent=2)}
-
----
-Published by {self.agent_name} - Autonomous Skill Orchestrator
-"""
+        Returns:
+            Unsigned Event ready for signing.
+        """
+        # Fill the precompiled content template with skill details
+        content = _SKILL_TEMPLATE.format_map({
+            'title': skill_data.get('title', 'Skill Update'),
+            'description': skill_data.get('description', ''),
+            'version': skill_data.get('version', '1.0.0'),
+            'instructions': skill_data.get('instructions', ''),
+            'tool_calls_json': _json_dumps(skill_data.get('tool_calls', [])),
+            'agent_name': self.agent_name,
+        })
 
         # Create tags
         tags = [
@@ -163,22 +229,89 @@ Published by {self.agent_name} - Autonomous Skill Orchestrator
             ["t", "orchestrator"]
         ]
 
-        event = Event(
-            public_key=self.public_key.hex(),
+        return Event(
+            public_key=self._pub_hex,
             content=content,
             kind=EventKind.LONG_FORM_CONTENT,
             tags=tags,
             created_at=int(time.time())
         )
 
-        event.sign(self.private_key.hex())
+    def publish_skill(self, skill_data: Dict[str, Any], category: str):
+        """
+        Broadcast Kind 30023 (Long-form Content) event for skill updates.
+
+        Args:
+            skill_data: Dictionary containing skill information
+            category: Skill category for tagging
+        """
+        event = self._build_skill_event(skill_data, category)
+        event.sign(self._priv_hex)
 
-        message = json.dumps([ClientMessageType.EVENT, event.to_json_object()])
+        message = _json_dumps([ClientMessageType.EVENT, event.to_json_object()])
         self.relay_manager.publish_message(message)
 
         logger.info(f"Published skill event: {event.id} - {skill_data.get('title')}")
         return event.id
 
+    def publish_skills_batch(self, skills: List[Tuple[Dict[str, Any], str]]) -> List[str]:
+        """
+        Broadcast multiple Kind 30023 skill events in a single relay write.
+
+        Builds and signs every event up front, then sends all frames
+        back-to-back so a batch costs one socket round instead of N.
+
+        Args:
+            skills: List of (skill_data, category) tuples.
+
+        Returns:
+            List of published event IDs.
+        """
+        if not skills:
+            return []
+
+        events = [
+            self._build_skill_event(skill_data, category)
+            for skill_data, category in skills
+        ]
+
+        # Signing is CPU-bound secp256k1; spread big batches across cores
+        if len(events) >= _SIGN_POOL_MIN_BATCH:
+            priv_hex = self._priv_hex
+            jobs = [
+                ({
+                    'public_key': event.public_key,
+                    'content': event.content,
+                    'kind': event.kind,
+                    'tags': event.tags,
+                    'created_at': event.created_at,
+                }, priv_hex)
+                for event in events
+            ]
+            signed = list(_get_sign_pool().map(_sign_event_worker, jobs))
+        else:
+            signed = []
+            for event in events:
+                event.sign(self._priv_hex)
+                signed.append((event.id, event.to_json_object()))
+
+        messages = [
+            _json_dumps([ClientMessageType.EVENT, event_obj])
+            for _, event_obj in signed
+        ]
+
+        if hasattr(self.relay_manager, 'publish_messages'):
+            self.relay_manager.publish_messages(messages)
+        else:
+            # Fall back to back-to-back writes on the shared connection
+            for message in messages:
+                self.relay_manager.publish_message(message)
+
+        for (event_id, _), (skill_data, _) in zip(signed, skills):
+            logger.info(f"Published skill event: {event_id} - {skill_data.get('title')}")
+
+        return [event_id for event_id, _ in signed]
+
     def __enter__(self):
         """Context manager entry."""
         self.connect()
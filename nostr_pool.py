@@ -0,0 +1,180 @@
+"""
+Persistent Nostr Relay Connection Pool
+
+Maintains one long-lived websocket per relay URL so that repeated
+broadcasts (metadata, skill publishes, token launches) reuse a single
+TLS/WS handshake instead of reconnecting and sleeping on every call.
+
+Connections are health-checked with periodic pings and re-opened with
+exponential backoff if the socket drops.
+"""
+
+import logging
+import threading
+import time
+
+from nostr.relay_manager import RelayManager
+
+logger = logging.getLogger(__name__)
+
+
+class RelayPool:
+    """
+    Shared, persistent connection to a single Nostr relay.
+
+    Callers acquire()/release() the underlying RelayManager; the websocket
+    stays open between uses so publishes are not charged a handshake.
+    """
+
+    PING_INTERVAL = 30  # seconds between keepalive pings
+    CONNECT_TIMEOUT = 5  # seconds to wait for the socket to come up
+    MAX_BACKOFF = 60  # cap for reconnect backoff
+
+    def __init__(self, relay_url: str):
+        self.relay_url = relay_url
+        self.relay_manager = RelayManager()
+        self.relay_manager.add_relay(relay_url)
+
+        self._lock = threading.Lock()
+        self._connected = threading.Event()
+        self._holders = 0
+        self._opened = False
+        self._keepalive_thread = None
+
+    def acquire(self) -> RelayManager:
+        """
+        Get the shared RelayManager, opening the connection on first use.
+
+        Blocks until the websocket reports connected (up to CONNECT_TIMEOUT)
+        instead of sleeping a fixed interval.
+        """
+        with self._lock:
+            self._holders += 1
+            if not self._opened:
+                self.relay_manager.open_connections()
+                self._opened = True
+                self._start_keepalive()
+
+        if not self._connected.wait(timeout=self.CONNECT_TIMEOUT):
+            logger.warning(f"Relay {self.relay_url} not confirmed connected after {self.CONNECT_TIMEOUT}s")
+
+        return self.relay_manager
+
+    def release(self):
+        """
+        Release a hold on the pool.
+
+        The websocket is intentionally kept open so the next caller reuses
+        it; use close() for explicit shutdown.
+        """
+        with self._lock:
+            if self._holders > 0:
+                self._holders -= 1
+
+    def close(self):
+        """Close the underlying connection (process shutdown)."""
+        with self._lock:
+            if self._opened:
+                self._opened = False
+                self._connected.clear()
+                try:
+                    self.relay_manager.close_connections()
+                except Exception as e:
+                    logger.warning(f"Error closing relay connections: {e}")
+
+    def _is_socket_connected(self) -> bool:
+        """Check the underlying websocket state for this pool's relay."""
+        relay = self.relay_manager.relays.get(self.relay_url)
+        if relay is None:
+            return False
+        ws = getattr(relay, "ws", None)
+        sock = getattr(ws, "sock", None)
+        return bool(sock and getattr(sock, "connected", False))
+
+    def _start_keepalive(self):
+        if self._keepalive_thread is None:
+            self._keepalive_thread = threading.Thread(
+                target=self._keepalive_loop,
+                name=f"relay-keepalive-{self.relay_url}",
+                daemon=True
+            )
+            self._keepalive_thread.start()
+
+    def _keepalive_loop(self):
+        """
+        Monitor the connection: set the connected event as soon as the
+        socket is up, ping periodically, and reconnect with exponential
+        backoff (1s -> 2s -> 4s ... capped) if the socket drops.
+        """
+        backoff = 1
+        last_ping = time.monotonic()
+
+        while True:
+            if not self._opened:
+                return
+
+            if self._is_socket_connected():
+                if not self._connected.is_set():
+                    self._connected.set()
+                    logger.info(f"Relay connection established: {self.relay_url}")
+                backoff = 1
+
+                if time.monotonic() - last_ping >= self.PING_INTERVAL:
+                    self._send_ping()
+                    last_ping = time.monotonic()
+
+                time.sleep(0.1)
+            elif self._connected.is_set():
+                # Connection dropped; reconnect with backoff
+                self._connected.clear()
+                logger.warning(f"Relay connection lost: {self.relay_url}, reconnecting in {backoff}s")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, self.MAX_BACKOFF)
+                try:
+                    self.relay_manager.open_connections()
+                except Exception as e:
+                    logger.error(f"Reconnect to {self.relay_url} failed: {e}")
+            else:
+                # Initial connect still in progress
+                time.sleep(0.1)
+
+    def _send_ping(self):
+        relay = self.relay_manager.relays.get(self.relay_url)
+        ws = getattr(relay, "ws", None)
+        sock = getattr(ws, "sock", None)
+        if sock is not None:
+            try:
+                sock.ping()
+            except Exception as e:
+                logger.warning(f"Ping to {self.relay_url} failed: {e}")
+
+
+# Module-level pool registry: one RelayPool per relay URL
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_relay(relay_url: str) -> RelayPool:
+    """
+    Get the shared RelayPool for a relay URL, creating it on first use.
+
+    Args:
+        relay_url: Websocket URL of the relay.
+
+    Returns:
+        The process-wide RelayPool for that relay.
+    """
+    with _pools_lock:
+        pool = _pools.get(relay_url)
+        if pool is None:
+            pool = RelayPool(relay_url)
+            _pools[relay_url] = pool
+        return pool
+
+
+def close_all():
+    """Close every pooled relay connection (process shutdown)."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
@@ -8,15 +8,32 @@ Registered as an OpenClaw skill for integration with the Clawstr agent framework
 """
 
 import os
+import hashlib
+import json
 import logging
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 from datetime import datetime
+import numpy as np
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 from utils.nlp_helper import NLPHelper
 from utils.git_manager import GitManager
+from utils.parse_cache import SkillParseCache
+from utils.embed_cache import EmbedCache
 
 try:
     from openclaw import Skill, SkillResult
@@ -35,6 +52,178 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Hot-path patterns, compiled once at import; bodies are merged as raw
+# UTF-8 bytes, so the section splitter works on bytes too
+_SECTION_SPLIT_RE = re.compile(rb"\n(?=#+\s)")
+
+# Frontmatter is typically < 2 KB; read one chunk up front and leave the
+# body on disk until a consolidation actually needs it
+_FRONTMATTER_CHUNK = 8192
+
+# Directories the discovery walk never descends into
+SKIP_DIRS = frozenset({
+    ".git", "archive", "node_modules", "__pycache__",
+    ".orchestrator_cache", ".venv", "venv",
+})
+
+
+def _load_body(skill: Dict[str, Any]) -> bytes:
+    """
+    Load a skill's Markdown body, reading it from disk on first use.
+
+    Kept as raw UTF-8 bytes throughout merging and publishing so the
+    body is never decoded and re-encoded along the way.
+
+    Args:
+        skill: Parsed skill dict (with file_path and body_offset).
+
+    Returns:
+        The body bytes, or b"" if it cannot be read.
+    """
+    if skill.get("body") is not None:
+        body = skill["body"]
+        return body if isinstance(body, bytes) else body.encode("utf-8")
+
+    offset = skill.get("body_offset")
+    if offset is None:
+        return b""
+    length = skill.get("body_length", -1)
+
+    try:
+        with open(skill["file_path"], "rb") as f:
+            f.seek(offset)
+            body = f.read(length).strip()
+    except OSError as e:
+        logger.warning(f"Failed to read body of {skill['file_path']}: {e}")
+        return b""
+
+    skill["body"] = body
+    return body
+
+
+def _merge_descriptions(skills: List[Dict[str, Any]]) -> str:
+    """Merge descriptions from multiple skills."""
+    descriptions = [s.get("description", "").strip() for s in skills if s.get("description")]
+
+    # dict.fromkeys dedupes in one C call while preserving order
+    unique_descriptions = list(dict.fromkeys(d for d in descriptions if d))
+
+    return " ".join(unique_descriptions)
+
+
+def _merge_bodies(skills: List[Dict[str, Any]]) -> bytes:
+    """
+    Merge Markdown bodies from multiple skills as raw UTF-8 bytes.
+
+    Strategy:
+    - Extract workflow steps from each skill
+    - Remove duplicate steps
+    - Combine into a unified workflow
+    """
+    bodies = [body for body in (_load_body(s) for s in skills) if body]
+
+    if not bodies:
+        return b"# Consolidated Workflow\n\nNo body content found."
+
+    all_sections = []
+    for body in bodies:
+        # Extract headers and content
+        sections = _SECTION_SPLIT_RE.split(body)
+        all_sections.extend([s.strip() for s in sections if s.strip()])
+
+    # Deduplicate sections, preserving first-seen order; key on a
+    # 16-byte digest so membership checks never compare full sections
+    unique_sections = list({
+        hashlib.blake2b(section, digest_size=16).digest(): section
+        for section in all_sections
+    }.values())
+
+    return b"# Consolidated Workflow\n\n" + b"\n\n".join(unique_sections)
+
+
+def _build_master_skill(skills: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build the consolidated master skill dict for a cluster.
+
+    Module-level (like the merge helpers it calls) so consolidation can
+    run in worker processes without pickling the orchestrator itself.
+
+    Args:
+        skills: Skills in the cluster, in cluster order.
+
+    Returns:
+        Consolidated skill dict.
+    """
+    # Compute each merged field once and share it between the top level
+    # and the metadata sub-dict
+    master_name = f"{skills[0]['name']}_Master"
+    mver = max((s.get("_ver", (1, 0, 0)) for s in skills), default=(1, 0, 0))
+    mver = (mver + (0, 0, 0))[:3]  # pad short versions like "2.1"
+    master_version = f"{mver[0]}.{mver[1]}.{mver[2] + 1}"
+    description = _merge_descriptions(skills)
+    category = skills[0].get("category", "uncategorized")
+    tags = list({tag for s in skills for tag in s.get("tags", [])})
+    merged_from = [s["name"] for s in skills]
+
+    metadata = {
+        "name": master_name,
+        "description": description,
+        "version": master_version,
+        "author": "Clawstr Orchestrator",
+        "category": category,
+        "tags": tags,
+        "merged_from": merged_from,
+    }
+
+    return {
+        **metadata,
+        "consolidated_at": datetime.now().isoformat(),
+        "body": _merge_bodies(skills),
+        "metadata": metadata,
+    }
+
+
+def _consolidate_one(item: Tuple[str, List[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+    """Consolidate one (cluster_id, skills) pair; None for singleton clusters."""
+    cluster_id, skills = item
+    if len(skills) <= 1:
+        return None
+    logger.info(f"Consolidating {len(skills)} skills in {cluster_id}")
+    return _build_master_skill(skills)
+
+
+@dataclass
+class SkillTable:
+    """
+    Column-wise (struct-of-arrays) view of the discovered skills.
+
+    The bulk passes — embedding, clustering, version max — walk one
+    field across all skills at a time; parallel lists keep those walks
+    on flat arrays instead of chasing into N separate dicts.
+    """
+
+    names: List[str] = field(default_factory=list)
+    descriptions: List[str] = field(default_factory=list)
+    versions: List[Tuple[int, ...]] = field(default_factory=list)
+    paths: List[str] = field(default_factory=list)
+
+    def append(self, skill: Dict[str, Any]) -> None:
+        """Append one parsed skill's columns."""
+        self.names.append(skill["name"])
+        self.descriptions.append(skill.get("description", ""))
+        self.versions.append(skill.get("_ver", (1, 0, 0)))
+        self.paths.append(skill["file_path"])
+
+    def clear(self) -> None:
+        """Drop all rows."""
+        self.names.clear()
+        self.descriptions.clear()
+        self.versions.clear()
+        self.paths.clear()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
 
 class SkillOrchestratorConfig:
     """Configuration for the orchestrator."""
@@ -77,7 +266,15 @@ class SkillOrchestrator:
         """
         self.repo_path = Path(repo_path)
         self.config = config or SkillOrchestratorConfig()
-        self.nlp_helper = NLPHelper()
+        self.nlp_helper = NLPHelper(
+            cache_dir=self.repo_path / ".orchestrator_cache"
+        )
+        self.parse_cache = SkillParseCache(
+            self.repo_path / ".orchestrator_cache" / "skills.db"
+        )
+        self.embed_cache = EmbedCache(
+            self.repo_path / ".orchestrator_cache" / "embeddings.db"
+        )
         
         self.git_manager = None
         if enable_git:
@@ -88,6 +285,7 @@ class SkillOrchestrator:
                 logger.warning(f"Git initialization failed: {e}")
         
         self.discovered_skills = []
+        self.skill_table = SkillTable()
         self.clusters = {}
     
     # ===================== DISCOVERY PHASE =====================
@@ -110,18 +308,71 @@ class SkillOrchestrator:
             return []
         
         self.discovered_skills = []
-        
-        for skill_file in target_path.glob("**/*.md"):
-            try:
-                skill_data = self._parse_skill_file(skill_file)
-                if skill_data:
-                    self.discovered_skills.append(skill_data)
-                    logger.info(f"Discovered skill: {skill_data['name']} ({skill_file})")
-            except Exception as e:
-                logger.error(f"Failed to parse {skill_file}: {e}")
-        
+        self.skill_table.clear()
+
+        # Parsing is I/O-bound (read + small YAML load); fan it out over
+        # a thread pool and collect results after the join
+        skill_files = list(self._iter_skill_files(target_path))
+        max_workers = min(32, 2 * (os.cpu_count() or 1))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._parse_skill_file_safe, skill_files))
+
+        for skill_file, skill_data in zip(skill_files, results):
+            if skill_data:
+                self.discovered_skills.append(skill_data)
+                self.skill_table.append(skill_data)
+                logger.info(f"Discovered skill: {skill_data['name']} ({skill_file})")
+
         logger.info(f"Total skills discovered: {len(self.discovered_skills)}")
         return self.discovered_skills
+
+    def _iter_skill_files(self, root: Path):
+        """
+        Yield paths of Markdown files under root via an os.scandir walk.
+
+        DirEntry objects carry the file type from the directory read, so
+        the walk skips the extra stat per entry that Path.glob pays, and
+        it never descends into SKIP_DIRS.
+
+        Args:
+            root: Directory to walk.
+
+        Yields:
+            Paths of *.md files as strings.
+        """
+        stack = [str(root)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in SKIP_DIRS:
+                                stack.append(entry.path)
+                        elif entry.name.endswith(".md"):
+                            yield entry.path
+            except OSError as e:
+                logger.warning(f"Failed to scan directory: {e}")
+
+    def _parse_skill_file_safe(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """Parse a skill file, logging instead of raising on failure.
+
+        Checks the on-disk parse cache first; unchanged files (same
+        mtime and size) skip the read and YAML parse entirely.
+        """
+        cached = self.parse_cache.get(file_path)
+        if cached is not None:
+            return cached
+
+        try:
+            skill_data = self._parse_skill_file(file_path)
+        except Exception as e:
+            logger.error(f"Failed to parse {file_path}: {e}")
+            return None
+
+        if skill_data:
+            self.parse_cache.put(file_path, skill_data)
+        return skill_data
     
     def _parse_skill_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
         """
@@ -139,44 +390,65 @@ class SkillOrchestrator:
         
         Args:
             file_path: Path to the SKILL.md file.
-            
+
         Returns:
             Dictionary with parsed skill data, or None if parsing fails.
+            The Markdown body is not read here; it is loaded lazily via
+            _load_body only for skills that end up being consolidated.
         """
-        content = file_path.read_text(encoding="utf-8")
-        
-        # Extract YAML frontmatter
-        pattern = r"^---\n(.*?)\n---\n(.*)"
-        match = re.match(pattern, content, re.DOTALL)
-        
-        if not match:
-            logger.warning(f"No YAML frontmatter found in {file_path}")
-            return None
-        
+        # Read just the frontmatter chunk; most skills never need their
+        # body decoded at all
+        with open(file_path, "rb") as f:
+            file_size = os.fstat(f.fileno()).st_size
+            head = f.read(_FRONTMATTER_CHUNK)
+
+            if not head.startswith(b"---\n"):
+                logger.warning(f"No YAML frontmatter found in {file_path}")
+                return None
+
+            end = head.find(b"\n---\n", 4)
+            if end < 0:
+                # Frontmatter spills past the first chunk; read the rest
+                head += f.read()
+                end = head.find(b"\n---\n", 4)
+                if end < 0:
+                    logger.warning(f"No YAML frontmatter found in {file_path}")
+                    return None
+
         try:
-            frontmatter = yaml.safe_load(match.group(1))
-            body = match.group(2).strip()
-            
+            frontmatter = yaml.load(head[4:end], Loader=_YamlLoader)
+
             # Ensure required fields
             if not frontmatter.get("name"):
                 logger.warning(f"Skill missing 'name' field: {file_path}")
                 return None
-            
+
+            # Parse the version into an int tuple once, so later max()
+            # comparisons are numeric ("10.0.0" > "2.0.0") and cheap
+            version = str(frontmatter.get("version", "1.0.0"))
+            try:
+                ver_tuple = tuple(int(x) for x in version.split("."))
+            except ValueError:
+                ver_tuple = (1, 0, 0)
+
             return {
                 "name": frontmatter.get("name"),
                 "description": frontmatter.get("description", ""),
-                "version": frontmatter.get("version", "1.0.0"),
+                "version": version,
+                "_ver": ver_tuple,
                 "author": frontmatter.get("author", "Unknown"),
                 "category": frontmatter.get("category", "uncategorized"),
                 "tags": frontmatter.get("tags", []),
                 "metadata": frontmatter,
-                "body": body,
+                "body": None,  # loaded on demand by _load_body
+                "body_offset": end + 5,
+                "body_length": max(file_size - (end + 5), 0),
                 "file_path": str(file_path)
             }
         except yaml.YAMLError as e:
             logger.error(f"YAML parsing error in {file_path}: {e}")
             return None
-    
+
     # ===================== CLUSTERING PHASE =====================
     
     def cluster_skills(self, threshold: Optional[float] = None) -> Dict[str, List[Dict]]:
@@ -192,14 +464,68 @@ class SkillOrchestrator:
         if not self.discovered_skills:
             logger.warning("No skills to cluster. Run discover_skills() first.")
             return {}
-        
+
         threshold = threshold or self.config.similarity_threshold
-        
-        self.clusters = self.nlp_helper.cluster_skills(
-            self.discovered_skills,
-            threshold=threshold
-        )
-        
+
+        # Probe the persistent embedding cache first; only texts not seen
+        # in a previous run hit the transformer. Read the description and
+        # name columns rather than poking into each skill dict
+        texts = [
+            desc or name or ""
+            for desc, name in zip(
+                self.skill_table.descriptions, self.skill_table.names
+            )
+        ]
+        keys = [EmbedCache.key(text) for text in texts]
+
+        # The text-hash sequence plus threshold identifies a clustering
+        # exactly; repeat runs (agent retry loops) load the memoized
+        # grouping and skip the whole NLP phase
+        cluster_key = hashlib.blake2b(
+            ("|".join(keys) + f"|{threshold}").encode("utf-8"),
+            digest_size=16
+        ).hexdigest()
+        cached_clusters = self._load_cluster_cache(cluster_key)
+        if cached_clusters is not None:
+            self.clusters = cached_clusters
+            logger.info(
+                f"Loaded {len(self.clusters)} cluster(s) from cache for "
+                f"{len(self.discovered_skills)} skills"
+            )
+            return self.clusters
+
+        cached = [self.embed_cache.get(key) for key in keys]
+        miss_indices = [i for i, vec in enumerate(cached) if vec is None]
+
+        dim = next((vec.shape[0] for vec in cached if vec is not None), None)
+        fresh = None
+        if miss_indices:
+            fresh = self.nlp_helper.embed_all(
+                [self.discovered_skills[i] for i in miss_indices]
+            )
+            dim = fresh.shape[1]
+
+        # Assemble one preallocated matrix: cached rows are assigned
+        # directly, fresh rows land via a single indexed scatter instead
+        # of a per-item Python rebuild of the whole array
+        embeddings = np.empty((len(keys), dim), dtype=np.float32)
+        for i, vec in enumerate(cached):
+            if vec is not None:
+                embeddings[i] = vec
+        if miss_indices:
+            embeddings[miss_indices] = fresh
+            for i, vec in zip(miss_indices, fresh):
+                self.embed_cache.put(keys[i], vec)
+
+        # All pairwise cosines in a single GEMM over the normalized
+        # embedding matrix, then union-find over the threshold edges
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        embeddings /= np.maximum(norms, 1e-12)
+        similarity = embeddings @ embeddings.T
+
+        self.clusters = self._group_by_similarity(similarity, threshold)
+        self._save_cluster_cache(cluster_key, self.clusters)
+
         logger.info(f"Clustered {len(self.discovered_skills)} skills into {len(self.clusters)} groups")
         
         for cluster_id, skills in self.clusters.items():
@@ -207,7 +533,107 @@ class SkillOrchestrator:
             logger.info(f"{cluster_id}: {names}")
         
         return self.clusters
-    
+
+    def _group_by_similarity(
+        self,
+        similarity: "np.ndarray",
+        threshold: float
+    ) -> Dict[str, List[Dict]]:
+        """
+        Build clusters from a pairwise similarity matrix via union-find.
+
+        Args:
+            similarity: (N, N) cosine similarity matrix.
+            threshold: Minimum similarity for two skills to share a cluster.
+
+        Returns:
+            Dictionary mapping cluster IDs to skill lists.
+        """
+        n = len(self.discovered_skills)
+        parent = list(range(n))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]  # path halving
+                i = parent[i]
+            return i
+
+        for i, j in np.argwhere(np.triu(similarity >= threshold, k=1)):
+            root_i, root_j = find(int(i)), find(int(j))
+            if root_i != root_j:
+                parent[root_j] = root_i
+
+        clusters: Dict[str, List[Dict]] = {}
+        cluster_ids: Dict[int, str] = {}
+        for idx, skill in enumerate(self.discovered_skills):
+            root = find(idx)
+            if root not in cluster_ids:
+                cluster_ids[root] = f"cluster_{len(cluster_ids)}"
+            clusters.setdefault(cluster_ids[root], []).append(skill)
+
+        return clusters
+
+    def _cluster_cache_path(self, cluster_key: str) -> Path:
+        """Path of the memoized cluster map for a content key."""
+        return (
+            self.repo_path / ".orchestrator_cache" / "clusters"
+            / f"{cluster_key}.json"
+        )
+
+    def _load_cluster_cache(self, cluster_key: str) -> Optional[Dict[str, List[Dict]]]:
+        """
+        Load a memoized clustering, rebuilt against discovered_skills.
+
+        The cache stores skill indices per cluster; the key hashes the
+        in-order description hashes, so indices stay valid on a hit.
+
+        Args:
+            cluster_key: Content key for the clustering.
+
+        Returns:
+            The cluster map, or None on miss or unreadable cache.
+        """
+        cache_path = self._cluster_cache_path(cluster_key)
+        if not cache_path.exists():
+            return None
+
+        try:
+            groups = json.loads(cache_path.read_text(encoding="utf-8"))
+            return {
+                cluster_id: [self.discovered_skills[i] for i in indices]
+                for cluster_id, indices in groups.items()
+            }
+        except (OSError, ValueError, IndexError) as e:
+            logger.warning(f"Ignoring unreadable cluster cache: {e}")
+            return None
+
+    def _save_cluster_cache(
+        self,
+        cluster_key: str,
+        clusters: Dict[str, List[Dict]]
+    ) -> None:
+        """
+        Persist a clustering as skill indices per cluster.
+
+        Args:
+            cluster_key: Content key for the clustering.
+            clusters: Cluster map to persist.
+        """
+        index_of = {id(s): i for i, s in enumerate(self.discovered_skills)}
+        groups = {
+            cluster_id: [index_of[id(s)] for s in skills]
+            for cluster_id, skills in clusters.items()
+        }
+
+        cache_path = self._cluster_cache_path(cluster_key)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps(groups), encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to persist cluster cache: {e}")
+
     # ===================== CONSOLIDATION PHASE =====================
     
     def consolidate_cluster(self, cluster_id: str) -> Optional[Dict[str, Any]]:
@@ -237,101 +663,8 @@ class SkillOrchestrator:
             return None
         
         logger.info(f"Consolidating {len(skills)} skills in {cluster_id}")
-        
-        # Create master skill metadata
-        master_name = f"{skills[0]['name']}_Master"
-        master_version = self._increment_version(
-            max((s.get("version", "1.0.0") for s in skills), default="1.0.0")
-        )
-        
-        master_skill = {
-            "name": master_name,
-            "description": self._merge_descriptions(skills),
-            "version": master_version,
-            "author": "Clawstr Orchestrator",
-            "category": skills[0].get("category", "uncategorized"),
-            "tags": list(set(tag for s in skills for tag in s.get("tags", []))),
-            "merged_from": [s["name"] for s in skills],
-            "consolidated_at": datetime.now().isoformat(),
-            "body": self._merge_bodies(skills),
-            "metadata": {
-                "name": master_name,
-                "description": self._merge_descriptions(skills),
-                "version": master_version,
-                "author": "Clawstr Orchestrator",
-                "category": skills[0].get("category", "uncategorized"),
-                "tags": list(set(tag for s in skills for tag in s.get("tags", []))),
-                "merged_from": [s["name"] for s in skills],
-            }
-        }
-        
-        return master_skill
-    
-    def _merge_descriptions(self, skills: List[Dict[str, Any]]) -> str:
-        """Merge descriptions from multiple skills."""
-        descriptions = [s.get("description", "").strip() for s in skills if s.get("description")]
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_descriptions = []
-        for desc in descriptions:
-            if desc and desc not in seen:
-                seen.add(desc)
-                unique_descriptions.append(desc)
-        
-        return " ".join(unique_descriptions)
-    
-    def _merge_bodies(self, skills: List[Dict[str, Any]]) -> str:
-        """
-        Merge Markdown bodies from multiple skills.
-        
-        Strategy:
-        - Extract workflow steps from each skill
-        - Remove duplicate steps
-        - Combine into a unified workflow
-        """
-        bodies = [s.get("body", "") for s in skills if s.get("body")]
-        
-        if not bodies:
-            return "# Consolidated Workflow\n\nNo body content found."
-        
-        merged_content = "# Consolidated Workflow\n\n"
-        
-        all_sections = []
-        for body in bodies:
-            # Extract headers and content
-            sections = re.split(r"\n(?=#+\s)", body)
-            all_sections.extend([s.strip() for s in sections if s.strip()])
-        
-        # Deduplicate sections
-        seen_sections = set()
-        unique_sections = []
-        for section in all_sections:
-            if section not in seen_sections:
-                seen_sections.add(section)
-                unique_sections.append(section)
-        
-        merged_content += "\n\n".join(unique_sections)
-        
-        return merged_content
-    
-    def _increment_version(self, version_str: str) -> str:
-        """
-        Increment a semantic version string.
-        
-        Args:
-            version_str: Version in format "major.minor.patch"
-            
-        Returns:
-            Incremented version with patch bumped.
-        """
-        try:
-            parts = version_str.split(".")
-            major, minor, patch = int(parts[0]), int(parts[1]), int(parts[2])
-            patch += 1
-            return f"{major}.{minor}.{patch}"
-        except Exception:
-            return "1.0.1"
+
+        return _build_master_skill(skills)
     
     # ===================== PUBLISHING PHASE =====================
     
@@ -359,13 +692,23 @@ class SkillOrchestrator:
         
         # Build YAML frontmatter
         metadata = consolidated_skill["metadata"]
-        yaml_content = yaml.dump(metadata, default_flow_style=False, sort_keys=False)
-        
-        # Build complete file content
-        file_content = f"---\n{yaml_content}---\n\n{consolidated_skill['body']}\n"
+        yaml_content = yaml.dump(
+            metadata, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False
+        )
         
+        # Build complete file content; the body is already UTF-8 bytes
+        # from _merge_bodies, so only the frontmatter needs encoding.
+        # Write via a tmp sibling so a crash never leaves a half-written
+        # skill file
+        body = consolidated_skill["body"]
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        data = b"---\n" + yaml_content.encode("utf-8") + b"---\n\n" + body + b"\n"
+
         try:
-            skill_filename.write_text(file_content, encoding="utf-8")
+            tmp_path = skill_filename.with_suffix(".md.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, skill_filename)
             logger.info(f"Published consolidated skill: {skill_filename}")
             return skill_filename
         except Exception as e:
@@ -384,18 +727,22 @@ class SkillOrchestrator:
         """
         archive_path = self.repo_path / self.config.archive_dir
         archive_path.mkdir(parents=True, exist_ok=True)
-        
+
+        # O(1) membership instead of scanning the name list per skill
+        skill_name_set = frozenset(skill_names)
         archived = []
-        
+
         for skill in self.discovered_skills:
-            if skill["name"] in skill_names:
+            if skill["name"] in skill_name_set:
                 src = Path(skill["file_path"])
-                if src.exists():
-                    dest = archive_path / src.name
-                    src.rename(dest)
-                    archived.append(dest)
-                    logger.info(f"Archived: {src} -> {dest}")
-        
+                dest = archive_path / src.name
+                try:
+                    os.replace(src, dest)
+                except FileNotFoundError:
+                    continue
+                archived.append(dest)
+                logger.info(f"Archived: {src} -> {dest}")
+
         return archived
     
     # ===================== GIT OPERATIONS =====================
@@ -487,21 +834,32 @@ class SkillOrchestrator:
         logger.info("\n[Phase 3] Consolidating clusters...")
         consolidated = []
         archivable_skills = []
-        
-        for cluster_id, cluster_skills in clusters.items():
-            if len(cluster_skills) > 1:
-                master = self.consolidate_cluster(cluster_id)
+
+        cluster_items = [
+            (cluster_id, cluster_skills)
+            for cluster_id, cluster_skills in clusters.items()
+            if len(cluster_skills) > 1
+        ]
+
+        if cluster_items:
+            # Text merging is CPU-bound and per-cluster independent, so
+            # fan it out across worker processes
+            with ProcessPoolExecutor() as executor:
+                masters = list(executor.map(_consolidate_one, cluster_items))
+
+            for (_, cluster_skills), master in zip(cluster_items, masters):
                 if master:
                     consolidated.append(master)
                     archivable_skills.extend([s["name"] for s in cluster_skills])
-        
+
         # Phase 4: Publishing
         logger.info("\n[Phase 4] Publishing consolidated skills...")
         published = []
-        for skill in consolidated:
-            result = self.publish_consolidated_skill(skill)
-            if result:
-                published.append(str(result))
+        if consolidated:
+            # File writes are I/O-bound; overlap them on threads
+            with ThreadPoolExecutor() as executor:
+                results = list(executor.map(self.publish_consolidated_skill, consolidated))
+            published = [str(r) for r in results if r]
         
         # Phase 5: Archiving
         logger.info("\n[Phase 5] Archiving original skills...")
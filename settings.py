@@ -0,0 +1,43 @@
+"""
+Process-wide Settings for the Clawstr Skill Orchestrator
+
+Reads environment-derived configuration once into a frozen dataclass so
+hot paths (per-request health checks, per-heartbeat client construction)
+use attribute access instead of repeated os.getenv lookups.
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Immutable snapshot of the orchestrator's environment configuration."""
+
+    nsec: Optional[str]
+    relay_url: str
+    agent_name: str
+    token_ticker: str
+
+
+@lru_cache(maxsize=1)
+def settings() -> Settings:
+    """
+    Build (once) and return the cached Settings snapshot.
+
+    Returns:
+        Frozen Settings built from the process environment.
+    """
+    return Settings(
+        nsec=os.getenv('NOSTR_NSEC'),
+        relay_url=os.getenv('NOSTR_RELAY', 'wss://lightningrelay.com'),
+        agent_name=os.getenv('AGENT_NAME', 'MasterOrchestrator'),
+        token_ticker=os.getenv('TOKEN_TICKER', 'SKILL'),
+    )
@@ -0,0 +1,78 @@
+"""
+Embedding Cache Module
+
+SQLite-backed persistent cache of description embeddings keyed by a
+content hash, so re-clustering across runs skips transformer inference
+for texts that haven't changed.
+"""
+
+import hashlib
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EmbedCache:
+    """Persists embedding vectors across orchestrator runs."""
+
+    def __init__(self, cache_path: str):
+        """
+        Initialize the cache, creating the database if needed.
+
+        Args:
+            cache_path: Path to the SQLite database file.
+        """
+        self.cache_path = Path(cache_path)
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS emb (hash TEXT PRIMARY KEY, vec BLOB)"
+        )
+        self.conn.commit()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(text: str) -> str:
+        """Content-hash key for a text."""
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """
+        Look up a cached embedding vector.
+
+        Args:
+            key: Content-hash key from EmbedCache.key().
+
+        Returns:
+            The float32 embedding vector, or None on miss.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT vec FROM emb WHERE hash = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+        return np.frombuffer(row[0], dtype=np.float32)
+
+    def put(self, key: str, vec: np.ndarray) -> None:
+        """
+        Store an embedding vector.
+
+        Args:
+            key: Content-hash key from EmbedCache.key().
+            vec: Embedding vector to persist.
+        """
+        blob = np.asarray(vec, dtype=np.float32).tobytes()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO emb (hash, vec) VALUES (?, ?)", (key, blob)
+            )
+            self.conn.commit()
@@ -0,0 +1,117 @@
+"""
+Embedding Store Module
+
+Memory-mapped float32 vector store with a pickled {hash: row} index,
+persisting NLPHelper's in-process embedding cache across runs so
+descriptions are not re-encoded on every invocation.
+"""
+
+import pickle
+import logging
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Rows are pre-allocated in chunks so appends rarely resize the file
+_GROW_CHUNK = 1024
+
+
+class EmbeddingStore:
+    """Append-only on-disk embedding matrix keyed by content hash."""
+
+    def __init__(self, store_dir: str):
+        """
+        Initialize the store, loading any existing index and data.
+
+        Args:
+            store_dir: Directory holding the index and vector files.
+        """
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.store_dir / "embeddings.idx"
+        self.data_path = self.store_dir / "embeddings.dat"
+
+        self.index = {}
+        self.dim = None
+        self.rows = 0
+        self._mmap = None
+        self._load()
+
+    def _load(self) -> None:
+        """Map the existing store into memory, or start empty."""
+        if not (self.index_path.exists() and self.data_path.exists()):
+            return
+
+        try:
+            with open(self.index_path, "rb") as f:
+                meta = pickle.load(f)
+            self.index = meta["index"]
+            self.dim = meta["dim"]
+            self.rows = meta["rows"]
+
+            capacity = self.data_path.stat().st_size // (4 * self.dim)
+            if capacity < self.rows:
+                raise ValueError("data file shorter than index claims")
+            self._mmap = np.memmap(
+                self.data_path, dtype="float32", mode="r+",
+                shape=(capacity, self.dim)
+            )
+        except Exception as e:
+            logger.warning(f"Resetting corrupt embedding store: {e}")
+            self.index = {}
+            self.dim = None
+            self.rows = 0
+            self._mmap = None
+
+    def _grow(self, capacity: int) -> None:
+        """Extend the data file and remap it at the new capacity."""
+        with open(self.data_path, "ab") as f:
+            f.truncate(capacity * 4 * self.dim)
+        self._mmap = np.memmap(
+            self.data_path, dtype="float32", mode="r+",
+            shape=(capacity, self.dim)
+        )
+
+    def _flush_index(self) -> None:
+        """Persist the {hash: row} index next to the data file."""
+        with open(self.index_path, "wb") as f:
+            pickle.dump({"index": self.index, "dim": self.dim, "rows": self.rows}, f)
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """
+        Look up a stored embedding vector.
+
+        Args:
+            key: Content-hash key for the text.
+
+        Returns:
+            A copy of the float32 vector, or None on miss.
+        """
+        row = self.index.get(key)
+        if row is None or self._mmap is None:
+            return None
+        return np.array(self._mmap[row])
+
+    def put(self, key: str, vec: np.ndarray) -> None:
+        """
+        Append an embedding vector under the given key.
+
+        Args:
+            key: Content-hash key for the text.
+            vec: Embedding vector to persist.
+        """
+        vec = np.asarray(vec, dtype=np.float32).ravel()
+        if self.dim is None:
+            self.dim = vec.shape[0]
+
+        capacity = 0 if self._mmap is None else self._mmap.shape[0]
+        if self.rows >= capacity:
+            self._grow(capacity + _GROW_CHUNK)
+
+        self._mmap[self.rows] = vec
+        self.index[key] = self.rows
+        self.rows += 1
+        self._flush_index()
@@ -34,10 +34,12 @@ class GitManager:
         
         self.repo = Repo(str(self.repo_path))
         
-        # Get current user config or use defaults
+        # Get current user config or use defaults; one reader parses the
+        # config files once for both values
         try:
-            self.user_name = self.repo.config_reader().get_value("user", "name")
-            self.user_email = self.repo.config_reader().get_value("user", "email")
+            with self.repo.config_reader() as config:
+                self.user_name = config.get_value("user", "name")
+                self.user_email = config.get_value("user", "email")
         except Exception:
             self.user_name = "Clawstr Orchestrator"
             self.user_email = "orchestrator@clawstr.ai"
@@ -49,9 +51,12 @@ class GitManager:
         Args:
             file_paths: List of file paths (relative to repo root) to stage.
         """
-        for file_path in file_paths:
-            self.repo.index.add([file_path])
-            logger.info(f"Staged: {file_path}")
+        if not file_paths:
+            return
+
+        # One index write for the whole batch instead of one per file
+        self.repo.index.add(list(file_paths))
+        logger.info(f"Staged {len(file_paths)} path(s): {', '.join(file_paths)}")
     
     def remove_files(self, file_paths: List[str]) -> None:
         """
@@ -60,10 +65,12 @@ class GitManager:
         Args:
             file_paths: List of file paths to remove.
         """
-        for file_path in file_paths:
-            if (self.repo_path / file_path).exists():
-                self.repo.index.remove([file_path])
-                logger.info(f"Removed: {file_path}")
+        existing = [fp for fp in file_paths if (self.repo_path / fp).exists()]
+        if not existing:
+            return
+
+        self.repo.index.remove(existing)
+        logger.info(f"Removed {len(existing)} path(s): {', '.join(existing)}")
     
     def commit(self, message: str, author_name: Optional[str] = None,
                author_email: Optional[str] = None) -> Optional[str]:
@@ -78,9 +85,14 @@ class GitManager:
         Returns:
             Commit hash, or None if there are no changes to commit.
         """
-        if not self.repo.index.diff("HEAD"):
+        # --quiet exits nonzero when staged diffs exist, giving a boolean
+        # answer without materializing per-file diff objects
+        try:
+            self.repo.git.diff("--cached", "--quiet")
             logger.info("No changes to commit")
             return None
+        except GitCommandError:
+            pass
         
         author_name = author_name or self.user_name
         author_email = author_email or self.user_email
@@ -129,14 +141,15 @@ class GitManager:
     def get_status(self) -> dict:
         """
         Get repository status.
-        
+
         Returns:
-            Dictionary with staged, unstaged, and untracked files.
+            Dictionary with staged, unstaged, and untracked file counts.
         """
+        status = self.repo.git.status("--porcelain").splitlines()
         return {
-            "staged": self.repo.index.diff("HEAD"),
-            "unstaged": self.repo.index.diff(),
-            "untracked": self.repo.untracked_files
+            "staged": sum(1 for line in status if line[:1] not in (" ", "?")),
+            "unstaged": sum(1 for line in status if line[1:2] not in (" ", "?")),
+            "untracked": sum(1 for line in status if line.startswith("??"))
         }
     
     def create_branch(self, branch_name: str) -> None:
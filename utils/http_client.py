@@ -0,0 +1,33 @@
+"""
+Shared HTTP Session for Outbound Requests
+
+Provides a single process-wide requests.Session with connection pooling
+and retry/backoff configured, so repeated calls (Clawstr registration
+retries, relay-adjacent HTTP endpoints) reuse TCP+TLS connections
+instead of handshaking per request.
+
+Usage:
+    from utils.http_client import SESSION
+
+    resp = SESSION.get(url, timeout=10)
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_retry = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 503, 504),
+)
+
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=_retry,
+)
+
+SESSION = requests.Session()
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
@@ -5,25 +5,280 @@ Provides utilities for comparing skill descriptions and clustering similar skill
 using sentence embeddings and cosine similarity.
 """
 
+import hashlib
+import logging
+import os
+from functools import lru_cache
+from importlib.util import find_spec
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
+
 import numpy as np
-from typing import List, Dict, Tuple
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+
+from utils.embed_store import EmbeddingStore
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer  # noqa: F401
+
+# The transformer stack (torch + sentence-transformers + sklearn) costs
+# seconds and hundreds of MB at import; probe availability cheaply here
+# and import inside the methods that actually encode
+TORCH_AVAILABLE = find_spec("torch") is not None
+OPTIMUM_AVAILABLE = (
+    find_spec("optimum") is not None and find_spec("onnxruntime") is not None
+)
+
+try:
+    # SIMD cosine kernels; optional, NumPy fallback below
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    SIMSIMD_AVAILABLE = False
+
+try:
+    # JIT for the clustering edge scan; optional, NumPy fallback below
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+
+def _text_key(text: str) -> bytes:
+    """
+    Content-hash key for the embedding caches.
+
+    The 16-byte digest is hashed once per text; dict lookups then
+    compare short fixed-size keys instead of rehashing multi-kilobyte
+    descriptions, and its hex form keys the on-disk store.
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+# A unit vector at the 0.85-cosine duplicate threshold differs from its
+# pair in ~11 of 64 SimHash bits on average; 24 leaves a wide margin
+_SIMHASH_MAX_HAMMING = 24
+
+
+@lru_cache(maxsize=4)
+def _simhash_projection(dim: int) -> np.ndarray:
+    """Fixed random hyperplanes for 64-bit SimHash signatures."""
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((dim, 64)).astype(np.float32)
+
+
+def _simhash_signatures(embeddings: np.ndarray) -> np.ndarray:
+    """Pack each embedding's projection signs into one uint64."""
+    bits = (embeddings @ _simhash_projection(embeddings.shape[1]) > 0)
+    return np.packbits(bits, axis=1).view(np.uint64).ravel()
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True)
+    def _union_tile(parent, tile, threshold, i0, j0):
+        """Union all above-threshold edges of one similarity tile."""
+        rows, cols = tile.shape
+        for bi in range(rows):
+            i = i0 + bi
+            for bj in range(cols):
+                j = j0 + bj
+                if i >= j or tile[bi, bj] < threshold:
+                    continue
+                root_i = i
+                while parent[root_i] != root_i:
+                    parent[root_i] = parent[parent[root_i]]
+                    root_i = parent[root_i]
+                root_j = j
+                while parent[root_j] != root_j:
+                    parent[root_j] = parent[parent[root_j]]
+                    root_j = parent[root_j]
+                if root_i != root_j:
+                    parent[root_j] = root_i
+
+
+class _ORTEncoder:
+    """
+    model.encode-compatible wrapper over an int8 ONNX export.
+
+    The model is exported and dynamically quantized once, cached under
+    the user cache dir, then served by ONNX Runtime on later runs.
+    """
+
+    def __init__(self, model_name: str, cache_dir: Path):
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+
+        onnx_dir = cache_dir / model_name.replace("/", "_")
+        quantized = onnx_dir / "model_quantized.onnx"
+
+        if not quantized.exists():
+            exported = ORTModelForFeatureExtraction.from_pretrained(
+                model_name, export=True
+            )
+            exported.save_pretrained(onnx_dir)
+            quantizer = ORTQuantizer.from_pretrained(onnx_dir)
+            quantizer.quantize(
+                save_dir=onnx_dir,
+                quantization_config=AutoQuantizationConfig.avx2(is_static=False),
+            )
+
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            onnx_dir, file_name=quantized.name
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+
+    def encode(self, texts, batch_size: int = 64, **_kwargs) -> np.ndarray:
+        """Mean-pooled embeddings for one text or a list of texts."""
+        if isinstance(texts, str):
+            return self.encode([texts], batch_size=batch_size)[0]
+
+        batches = []
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start:start + batch_size]
+            inputs = self.tokenizer(
+                batch, padding=True, truncation=True, return_tensors="pt"
+            )
+            hidden = self.model(**inputs).last_hidden_state
+            mask = inputs["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+            pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+            batches.append(pooled.cpu().numpy().astype(np.float32))
+
+        return np.concatenate(batches) if batches else np.empty((0, 0), np.float32)
 
 
 class NLPHelper:
     """Handles semantic similarity analysis for skill descriptions."""
     
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        quantize_int8: bool = False,
+        cache_dir: Optional[str] = ".orchestrator_cache",
+        bf16: bool = False,
+        use_onnx: bool = False
+    ):
         """
         Initialize the NLP helper with a pretrained sentence transformer model.
-        
+
         Args:
             model_name: HuggingFace model identifier for sentence embeddings.
                        Lightweight default for fast inference.
+            quantize_int8: Run clustering similarity on int8-quantized
+                          embeddings (VNNI-fast, 4x less bandwidth).
+                          Requires simsimd; thresholds tolerate the
+                          small rounding error. Duplicate detection
+                          stays float32 for precision.
+            cache_dir: Directory for the persistent embedding store, or
+                      None to keep the cache in-memory only.
+            bf16: Run the CPU forward pass under bfloat16 autocast,
+                 halving encoder bandwidth on hardware with BF16
+                 support. Cached embeddings stay float32.
+            use_onnx: Encode through a dynamically int8-quantized ONNX
+                     Runtime export of the model (needs optimum).
+        """
+        self.use_onnx = False
+        if use_onnx and OPTIMUM_AVAILABLE:
+            try:
+                self.model = _ORTEncoder(
+                    model_name, Path.home() / ".cache" / "skill_orch"
+                )
+                self.use_onnx = True
+            except Exception as e:
+                logger.warning(f"ONNX encoder unavailable, using PyTorch: {e}")
+
+        device = "cpu"
+        if not self.use_onnx:
+            # Deferred so importing this module stays cheap for callers
+            # that never encode
+            from sentence_transformers import SentenceTransformer
+            if TORCH_AVAILABLE:
+                import torch
+                if torch.cuda.is_available():
+                    device = "cuda"
+                else:
+                    # Default MKL config leaves most cores idle during
+                    # CPU encoding; interop setup can only happen once
+                    # per process, so tolerate a late call
+                    torch.set_num_threads(os.cpu_count() or 1)
+                    try:
+                        torch.set_num_interop_threads(2)
+                    except RuntimeError:
+                        pass
+            self.model = SentenceTransformer(model_name, device=device)
+            if device == "cuda":
+                # FP16 halves encoder bandwidth on GPU; embeddings come
+                # back float32 through the cache matrix
+                self.model.half()
+        self.device = device
+
+        self.quantize_int8 = quantize_int8 and SIMSIMD_AVAILABLE
+        self._bf16_autocast = (
+            bf16 and TORCH_AVAILABLE and device == "cpu" and not self.use_onnx
+        )
+
+        # SoA embedding cache: one contiguous (capacity, dim) float32
+        # matrix plus a digest -> row index, instead of a dict of tiny
+        # per-vector allocations keyed by full strings
+        self._text_to_row: Dict[bytes, int] = {}
+        self._emb_matrix: Optional[np.ndarray] = None
+        self._rows = 0
+
+        self.store = None
+        if cache_dir is not None:
+            try:
+                self.store = EmbeddingStore(Path(cache_dir) / "embeddings")
+            except OSError as e:
+                logger.warning(f"Embedding store unavailable: {e}")
+
+    @staticmethod
+    def _quantize(embeddings: np.ndarray) -> np.ndarray:
+        """Scale unit-norm float32 embeddings into int8 [-127, 127]."""
+        return np.clip(np.round(embeddings * 127.0), -127, 127).astype(np.int8)
+
+    def _cache_row(self, key: bytes, vec: np.ndarray) -> int:
         """
-        self.model = SentenceTransformer(model_name)
-        self.embeddings_cache = {}
+        Append one embedding as a row of the contiguous matrix.
+
+        The matrix doubles in capacity when full, so amortized appends
+        stay O(1).
+
+        Args:
+            key: Digest key of the embedded text.
+            vec: Its embedding vector.
+
+        Returns:
+            The row index assigned to the key.
+        """
+        vec = np.asarray(vec, dtype=np.float32).ravel()
+        # Normalize at insertion: every cached row is unit length, so
+        # downstream cosines reduce to plain dot products
+        vec = vec / max(float(np.linalg.norm(vec)), 1e-12)
+        if self._emb_matrix is None:
+            self._emb_matrix = np.empty((16, vec.shape[0]), dtype=np.float32)
+        elif self._rows >= self._emb_matrix.shape[0]:
+            grown = np.empty(
+                (self._emb_matrix.shape[0] * 2, self._emb_matrix.shape[1]),
+                dtype=np.float32
+            )
+            grown[:self._rows] = self._emb_matrix[:self._rows]
+            self._emb_matrix = grown
+
+        row = self._rows
+        self._emb_matrix[row] = vec
+        self._text_to_row[key] = row
+        self._rows += 1
+        return row
+
+    def _encode(self, texts, **kwargs):
+        """Run model.encode, under bfloat16 autocast when enabled."""
+        if self._bf16_autocast:
+            import torch
+            with torch.autocast("cpu", dtype=torch.bfloat16):
+                return self.model.encode(texts, **kwargs)
+        return self.model.encode(texts, **kwargs)
     
     def get_embedding(self, text: str) -> np.ndarray:
         """
@@ -35,13 +290,112 @@ class NLPHelper:
         Returns:
             Embedding vector as numpy array.
         """
-        if text in self.embeddings_cache:
-            return self.embeddings_cache[text]
-        
-        embedding = self.model.encode(text, convert_to_numpy=True)
-        self.embeddings_cache[text] = embedding
-        return embedding
+        key = _text_key(text)
+        row = self._text_to_row.get(key)
+        if row is not None:
+            return self._emb_matrix[row]
+
+        if self.store is not None:
+            stored = self.store.get(key.hex())
+            if stored is not None:
+                return self._emb_matrix[self._cache_row(key, stored)]
+
+        embedding = self._encode(text, convert_to_numpy=True)
+        row = self._cache_row(key, embedding)
+        if self.store is not None:
+            self.store.put(key.hex(), self._emb_matrix[row])
+        return self._emb_matrix[row]
     
+    def encode_many(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed many texts in one batched model.encode call, with caching.
+
+        Cache hits skip the model entirely; misses go through a single
+        forward pass, sorted by length so batches pad minimally.
+
+        Args:
+            texts: The texts to embed.
+
+        Returns:
+            (N, D) float32 matrix of embeddings, in input order.
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
+        keys = [_text_key(t) for t in texts]
+
+        # key -> text, deduped in input order
+        miss_map = {}
+        for key, text in zip(keys, texts):
+            if key not in self._text_to_row and key not in miss_map:
+                miss_map[key] = text
+
+        if miss_map and self.store is not None:
+            for key in list(miss_map):
+                stored = self.store.get(key.hex())
+                if stored is not None:
+                    self._cache_row(key, stored)
+                    del miss_map[key]
+
+        misses = list(miss_map.values())
+        key_of = {text: key for key, text in miss_map.items()}
+
+        if misses:
+            # Sort by token length and encode in same-length buckets,
+            # so each batch pads to its bucket bound instead of the
+            # longest text overall; batch size shrinks for long buckets
+            # to keep memory flat
+            tokenize = getattr(self.model.tokenizer, "tokenize", None)
+            if tokenize is not None:
+                lengths = {t: len(tokenize(t)) for t in misses}
+            else:
+                lengths = {t: len(t) for t in misses}
+            misses.sort(key=lengths.__getitem__)
+
+            base_batch = 128 if self.device == "cuda" else 64
+            bounds = (16, 32, 64, 128, float("inf"))
+
+            i = 0
+            while i < len(misses):
+                bound = next(b for b in bounds if lengths[misses[i]] <= b)
+                j = i
+                while j < len(misses) and lengths[misses[j]] <= bound:
+                    j += 1
+                bucket = misses[i:j]
+                i = j
+
+                batch_size = max(8, int(base_batch * 16 / min(bound, 256)))
+                encoded = self._encode(
+                    bucket,
+                    batch_size=batch_size,
+                    show_progress_bar=False,
+                    convert_to_numpy=True,
+                )
+                for text, embedding in zip(bucket, encoded):
+                    key = key_of[text]
+                    row = self._cache_row(key, embedding)
+                    if self.store is not None:
+                        self.store.put(key.hex(), self._emb_matrix[row])
+
+        # One fancy-index gather from the contiguous matrix
+        rows = [self._text_to_row[k] for k in keys]
+        return self._emb_matrix[rows]
+
+    def embed_all(self, skills: List[Dict[str, str]]) -> np.ndarray:
+        """
+        Embed every skill description into one (N, D) float32 matrix.
+
+        Args:
+            skills: List of skill dicts with 'name' and 'description' keys.
+
+        Returns:
+            Matrix of embeddings, one row per skill, in input order.
+        """
+        return self.encode_many([
+            skill.get("description") or skill.get("name") or ""
+            for skill in skills
+        ])
+
     def compute_similarity(self, text1: str, text2: str) -> float:
         """
         Compute cosine similarity between two texts.
@@ -55,9 +409,14 @@ class NLPHelper:
         """
         emb1 = self.get_embedding(text1)
         emb2 = self.get_embedding(text2)
-        
-        similarity = cosine_similarity([emb1], [emb2])[0][0]
-        return float(similarity)
+
+        if SIMSIMD_AVAILABLE:
+            emb1 = np.ascontiguousarray(emb1, dtype=np.float32)
+            emb2 = np.ascontiguousarray(emb2, dtype=np.float32)
+            return 1.0 - float(simsimd.cosine(emb1, emb2))
+
+        # Cached embeddings are unit-norm, so cosine is a dot product
+        return float(np.dot(emb1, emb2))
     
     def cluster_skills(
         self,
@@ -76,38 +435,72 @@ class NLPHelper:
         """
         if not skills:
             return {}
-        
-        # Compute embeddings for all descriptions
-        embeddings = np.array([
-            self.get_embedding(skill.get("description", skill.get("name", "")))
-            for skill in skills
-        ])
-        
-        # Compute pairwise similarities
-        similarity_matrix = cosine_similarity(embeddings)
-        
-        # Cluster using a greedy approach
-        clusters = {}
-        assigned = set()
-        cluster_id = 0
-        
-        for i, skill in enumerate(skills):
-            if i in assigned:
-                continue
-            
-            # Start a new cluster
-            cluster = [skill]
-            assigned.add(i)
-            
-            # Find similar skills
-            for j in range(i + 1, len(skills)):
-                if j not in assigned and similarity_matrix[i][j] >= threshold:
-                    cluster.append(skills[j])
-                    assigned.add(j)
-            
-            clusters[f"cluster_{cluster_id}"] = cluster
-            cluster_id += 1
-        
+
+        # Hoist the description/name fallback into one pass, then embed
+        # everything in a single batched call; cached rows are already
+        # unit-norm, so block matmuls below are cosine similarities
+        texts = [s.get("description") or s.get("name") or "" for s in skills]
+        embeddings = self.encode_many(texts)
+
+        quantized = self._quantize(embeddings) if self.quantize_int8 else None
+
+        # Union-find over threshold edges, one similarity tile at a
+        # time; the full N x N matrix is never materialized
+        n = len(skills)
+        parent = np.arange(n, dtype=np.int64)
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]  # path halving
+                i = int(parent[i])
+            return i
+
+        # 128 rows of 384-dim float32 is ~192 KB per operand, so both
+        # tiles of the matmul stay resident in a 512 KB L2 while reused;
+        # the symmetric lower triangle of tiles is never computed
+        block = 128
+        for i0 in range(0, n, block):
+            i1 = min(i0 + block, n)
+            for j0 in range(i0, n, block):
+                j1 = min(j0 + block, n)
+                if quantized is not None:
+                    tile = 1.0 - np.asarray(
+                        simsimd.cdist(quantized[i0:i1], quantized[j0:j1], metric="cosine")
+                    )
+                elif SIMSIMD_AVAILABLE:
+                    tile = 1.0 - np.asarray(
+                        simsimd.cdist(embeddings[i0:i1], embeddings[j0:j1], metric="cosine")
+                    )
+                else:
+                    tile = embeddings[i0:i1] @ embeddings[j0:j1].T
+
+                if NUMBA_AVAILABLE:
+                    _union_tile(
+                        parent, np.ascontiguousarray(tile), threshold, i0, j0
+                    )
+                    continue
+
+                # Candidate edges as one SIMD compare; diagonal tiles
+                # drop i >= j with a triangle mask instead of a
+                # data-dependent branch per element
+                mask = tile >= threshold
+                if i0 == j0:
+                    mask = np.triu(mask, k=1)
+
+                for bi, bj in np.argwhere(mask):
+                    root_i = find(i0 + int(bi))
+                    root_j = find(j0 + int(bj))
+                    if root_i != root_j:
+                        parent[root_j] = root_i
+
+        clusters: Dict[str, List[Dict[str, str]]] = {}
+        cluster_ids: Dict[int, str] = {}
+        for idx, skill in enumerate(skills):
+            root = find(idx)
+            if root not in cluster_ids:
+                cluster_ids[root] = f"cluster_{len(cluster_ids)}"
+            clusters.setdefault(cluster_ids[root], []).append(skill)
+
         return clusters
     
     def find_duplicates(
@@ -125,16 +518,30 @@ class NLPHelper:
         Returns:
             List of tuples: (skill1, skill2, similarity_score)
         """
-        duplicates = []
-        
-        for i in range(len(skills)):
-            for j in range(i + 1, len(skills)):
-                similarity = self.compute_similarity(
-                    skills[i].get("description", skills[i].get("name", "")),
-                    skills[j].get("description", skills[j].get("name", ""))
-                )
-                
-                if similarity >= threshold:
-                    duplicates.append((skills[i], skills[j], similarity))
-        
-        return duplicates
+        if not skills:
+            return []
+
+        texts = [s.get("description") or s.get("name") or "" for s in skills]
+        embeddings = self.encode_many(texts)
+
+        # SimHash prefilter: a 64-bit signature per skill and one XOR +
+        # popcount per pair weed out the obviously dissimilar; exact
+        # dot products run only on surviving candidates
+        signatures = _simhash_signatures(embeddings)
+        n = len(skills)
+        xor = np.bitwise_xor.outer(signatures, signatures)
+        hamming = np.unpackbits(
+            xor.view(np.uint8).reshape(n, n, 8), axis=2
+        ).sum(axis=2)
+
+        rows, cols = np.where(np.triu(hamming <= _SIMHASH_MAX_HAMMING, k=1))
+        if rows.size == 0:
+            return []
+
+        # Unit-norm rows make cosine a row-wise dot product
+        sims = np.einsum("ij,ij->i", embeddings[rows], embeddings[cols])
+        keep = sims >= threshold
+        return [
+            (skills[i], skills[j], float(s))
+            for i, j, s in zip(rows[keep].tolist(), cols[keep].tolist(), sims[keep])
+        ]
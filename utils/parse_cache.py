@@ -0,0 +1,88 @@
+"""
+Skill Parse Cache Module
+
+SQLite-backed cache of parsed SKILL.md data keyed by file path, mtime
+and size, so re-discovery of unchanged files costs a stat instead of a
+read plus YAML parse.
+"""
+
+import os
+import pickle
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SkillParseCache:
+    """Persists parsed skill dicts across orchestrator runs."""
+
+    def __init__(self, cache_path: str):
+        """
+        Initialize the cache, creating the database if needed.
+
+        Args:
+            cache_path: Path to the SQLite database file.
+        """
+        self.cache_path = Path(cache_path)
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Parsing runs on a thread pool, so share one connection behind a lock
+        self.conn = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, blob BLOB)"
+        )
+        self.conn.commit()
+        self._lock = threading.Lock()
+
+    def get(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Look up the parsed dict for a file if it is unchanged on disk.
+
+        Args:
+            file_path: Path to the skill file.
+
+        Returns:
+            The cached skill dict, or None on miss or stale entry.
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT mtime, size, blob FROM cache WHERE path = ?",
+                (str(file_path),)
+            ).fetchone()
+
+        if row and row[0] == st.st_mtime_ns and row[1] == st.st_size:
+            try:
+                return pickle.loads(row[2])
+            except Exception as e:
+                logger.warning(f"Dropping corrupt cache entry for {file_path}: {e}")
+        return None
+
+    def put(self, file_path: Path, skill_data: Dict[str, Any]) -> None:
+        """
+        Store the parsed dict for a file keyed by its current stat info.
+
+        Args:
+            file_path: Path to the skill file.
+            skill_data: Parsed skill dictionary to cache.
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return
+
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cache (path, mtime, size, blob) VALUES (?, ?, ?, ?)",
+                (str(file_path), st.st_mtime_ns, st.st_size, pickle.dumps(skill_data))
+            )
+            self.conn.commit()